@@ -7,9 +7,14 @@ def create_app():
     app.config.from_mapping(
         SECRET_KEY='your-secret-key',
         UPLOAD_FOLDER=os.path.join(app.instance_path, 'uploads'),
-        ALLOWED_EXTENSIONS=set(['pdf'])
+        ALLOWED_EXTENSIONS=frozenset({'pdf'}),
+        MAX_CONTENT_LENGTH=50 * 1024 * 1024  # Reject uploads larger than 50 MB
     )
 
+    # Cache the normalized extension set so allowed_file skips repeated
+    # config lookups through the app proxy
+    app.extensions['allowed_ext'] = frozenset(map(str.lower, app.config['ALLOWED_EXTENSIONS']))
+
     from . import views
     app.register_blueprint(views.bp)
 
@@ -0,0 +1,271 @@
+# Standard Library imports
+import re
+from collections import namedtuple
+from typing import Dict, List, Iterable, Optional
+
+# The per-line shift parsing below is the CPU-bound core of an upload
+# request. It is kept in its own fully type-annotated module so it can be
+# AOT-compiled with mypyc/Cython at build time; imported as-is it runs as
+# plain Python, which remains the fallback path.
+
+# Precompiled patterns for the per-line text-processing hot path. Compiling
+# once at import time avoids re-compilation (and the re-cache lookup) for
+# every line of a multi-page PDF.
+_PAT_REGULAR = re.compile(
+    r"(?P<date>[A-Za-z]+\.\s\d{2}\.\d{2}\.\d{4})\s(?P<time>\d{2}:\d{2}-\d{2}:\d{2})\s(?P<hours>\d{1,2},\d{2})(?P<entry>.*?)(?=Zeitraum|$)"
+)
+_PAT_ALL_DAY = re.compile(
+    r"(?P<date>[A-Za-z]+\.\s\d{2}\.\d{2}\.\d{4})\sGanztägig\s(?P<hours>\d{1,2},\d{2})(?P<entry>.*?)(?=Zeitraum|$)"
+)
+_PAT_TRAIL_ZERO = re.compile(r'0$')
+_PAT_TIME_RANGE = re.compile(r'\s?\d{1,2}-\d{1,2}')
+_PAT_TRAIL_NUM = re.compile(r'\s?\d+$')
+_PAT_INLINE_TIME = re.compile(r'\d{1,2}:\d{2}-\d{1,2}:\d{2}')
+_PAT_NAME = re.compile(r'^([a-zA-ZäöüÄÖÜß\s]+,\s*[a-zA-ZäöüÄÖÜß\s]+)')
+_PAT_WS = re.compile(r'\s+')
+_PAT_COMMA = re.compile(r'\s*,\s*')
+
+# Composite shift pattern: one search recognises both regular and all-day
+# lines (the 'time' group is None for the latter), sharing the weekday/date
+# prefix scan that the two separate patterns used to repeat.
+_PAT_SHIFT = re.compile(
+    r"(?P<wd>[A-Za-z]+\.)\s(?P<date>\d{2}\.\d{2}\.\d{4})\s(?:(?P<time>\d{2}:\d{2}-\d{2}:\d{2})|Ganztägig)\s(?P<hours>\d{1,2},\d{2})(?P<entry>.*?)(?=Zeitraum|$)"
+)
+
+# Single cleanup pass over a captured entry: inline times, time-range
+# indicators and trailing numbers in one alternation instead of four
+# separate substitutions
+_PAT_ENTRY_CLEAN = re.compile(r'\d{1,2}:\d{2}-\d{1,2}:\d{2}|\s?\d{1,2}-\d{1,2}|\s?\d+$|0$')
+
+# Mapping of German weekday tokens to their English abbreviations
+_DE2EN = {
+    'Mo.': 'Mon.',
+    'Di.': 'Tue.',
+    'Mi.': 'Wed.',
+    'Do.': 'Thu.',
+    'Fr.': 'Fri.',
+    'Sa.': 'Sat.',
+    'So.': 'Sun.'
+}
+
+# Single alternation matching any German weekday token, for one-pass
+# translation of arbitrary date strings
+_PAT_DE_WEEKDAY = re.compile(r'\b(?:Mo|Di|Mi|Do|Fr|Sa|So)\.')
+
+# Weekday tokens a shift line can start with (German and already-translated
+# English forms); used as a cheap prefilter before any regex runs.
+_WEEKDAY_PREFIXES = (
+    'Mo.', 'Di.', 'Mi.', 'Do.', 'Fr.', 'Sa.', 'So.',
+    'Mon.', 'Tue.', 'Wed.', 'Thu.', 'Fri.', 'Sat.', 'Sun.'
+)
+
+# A parsed shift record. A namedtuple is about a third the size of the
+# five-key dict it replaces, and attribute access runs at C level in the
+# statistics and iCal loops. Templates read the same field names, and
+# _asdict() is available where a mapping is required.
+Shift = namedtuple('Shift', 'date shift_time hours entry all_day')
+
+
+def german_to_english_weekday(date_string: str) -> str:
+    """Convert German weekdays to English.
+
+    Parameters:
+        date_string (str): The date string containing German weekdays.
+
+    Returns:
+        str: The date string with German weekdays converted to English.
+    """
+
+    # Replace German weekdays with English weekdays in a single pass; the
+    # alternation pattern beats seven sequential str.replace scans
+    return _PAT_DE_WEEKDAY.sub(lambda m: _DE2EN[m.group(0)], date_string)
+
+
+def normalize_entry(entry: str) -> str:
+    """Normalize an entry according to specified rules.
+
+    Args:
+        entry (str): The original entry string.
+
+    Returns:
+        str: The normalized entry string.
+    """
+
+    # Remove trailing zeros (e.g., "ILL0" becomes "ILL")
+    entry = _PAT_TRAIL_ZERO.sub('', entry)
+
+    # Remove time range indicators (e.g., "TRAIN 8-16" becomes "TRAIN")
+    entry = _PAT_TIME_RANGE.sub('', entry)
+
+    # Remove trailing numbers (e.g., "QUALITYM 12" becomes "QUALITYM")
+    entry = _PAT_TRAIL_NUM.sub('', entry)
+
+    # Remove any extra white spaces and return
+    return entry.strip()
+
+
+def process_line(line: str) -> Optional[Dict[str, str]]:
+    """Process individual lines from the extracted text."""
+    # Cheap prefilter: shift lines start with a weekday token and contain
+    # either a time range or the all-day marker. These O(1) string checks
+    # skip the regex machinery for the majority of discarded lines.
+    if not line.startswith(_WEEKDAY_PREFIXES):
+        return None
+    if 'Ganztägig' not in line and ':' not in line:
+        return None
+
+    # Dispatch on the all-day marker so each line runs exactly one pattern
+    # instead of trying both
+    if 'Ganztägig' in line:
+        match = _PAT_ALL_DAY.search(line)
+    else:
+        match = _PAT_REGULAR.search(line)
+
+    return match.groupdict() if match else None
+
+
+def process_extracted_text_lines(lines: Iterable[str]) -> List[Shift]:
+    """Process extracted text lines to capture relevant shift information.
+
+    Parameters:
+        lines (iterable): The individual text lines containing shift details.
+
+    Returns:
+        list: A list of Shift records containing processed shift details.
+    """
+
+    # Initialize an empty list to store shift details
+    shifts = []
+
+    # Process each line of the input
+    for line in lines:
+        # Cheap prefilter (see process_line): skip the regex machinery for
+        # lines that cannot be shift records
+        if not line.startswith(_WEEKDAY_PREFIXES):
+            continue
+        if 'Ganztägig' not in line and ':' not in line:
+            continue
+
+        match = _PAT_SHIFT.search(line)
+        if match:
+            # Translate the captured weekday token with a single dict lookup
+            weekday = match.group("wd")
+            date = _DE2EN.get(weekday, weekday) + ' ' + match.group("date")
+
+            # An unset 'time' group means the line used the all-day marker
+            shift_time = match.group("time")
+            is_all_day = shift_time is None
+            if is_all_day:
+                shift_time = "All Day"
+
+            # Normalize the entry with one combined cleanup substitution;
+            # strip first so the $-anchored alternatives see the real end
+            entry = _PAT_ENTRY_CLEAN.sub('', match.group("entry").strip()).strip()
+
+            # Add processed details to shifts
+            shifts.append(Shift(
+                date=date,
+                shift_time=shift_time,
+                hours=match.group("hours"),
+                entry=entry,
+                all_day=is_all_day
+            ))
+
+    return shifts
+
+
+def process_extracted_text(text: str) -> List[Shift]:
+    """Process extracted text to capture relevant shift information.
+
+    Parameters:
+        text (str): The raw text containing shift details.
+
+    Returns:
+        list: A list of Shift records containing processed shift details.
+    """
+    return process_extracted_text_lines(text.split("\n"))
+
+
+def normalize_name(name: str) -> str:
+    """Normalizes a name by removing any "(Forts.)" suffix from it.
+
+    Parameters:
+        name (str): The original name that may contain a "(Forts.)" suffix.
+
+    Returns:
+        str: The name with the "(Forts.)" suffix removed, if it was present.
+
+    Examples:
+        >>> normalize_name("John (Forts.)")
+        "John"
+        >>> normalize_name("John")
+        "John"
+
+    Notes:
+        - The function assumes that "(Forts.)" occurs only as a suffix in the name.
+        - This function is case-sensitive.
+    """
+
+    # Remove "(Forts.)" suffix from the name by splitting on it and taking the first part
+    return name.split(' (Forts.)')[0]
+
+
+def process_multiple_persons_text(text: str) -> Dict[str, List[Shift]]:
+    """
+    Process a block of text to extract information about multiple persons and their shifts.
+
+    Parameters:
+        text (str): The block of text containing information about multiple persons and their shifts.
+
+    Returns:
+        dict: A dictionary where each key is a normalized name and the value is a list of shift data for that person.
+
+    Example:
+        Input text:
+        "Doe, John\nShift 1\nShift 2\nDoe, Jane (Forts.)\nShift 3"
+        Output:
+        {"Doe, John": ["Shift 1", "Shift 2"], "Doe, Jane": ["Shift 3"]}
+    """
+
+    def clean_name(name: str) -> str:
+        """Clean up the name by removing extra white spaces and standardizing the format."""
+        name = name.strip()
+        name = _PAT_WS.sub(' ', name)  # Remove extra white spaces
+        return _PAT_COMMA.sub(', ', name)  # Ensure single space after comma
+
+    lines = text.strip().split("\n")
+    persons_data: Dict[str, List[Shift]] = {}
+    current_name = None
+    shift_data: List[str] = []  # This list will store the shift data associated with a name
+
+    for line in lines:
+        # Regular expression pattern to match names
+        name_match = _PAT_NAME.search(line)
+
+        if name_match:
+            if current_name:
+                # Process the shift information for the previous person
+                processed_shifts = process_extracted_text_lines(shift_data)
+                if processed_shifts:
+                    persons_data[current_name].extend(processed_shifts)
+                shift_data = []  # Clear shift data before moving on to the next person
+
+            # Clean and normalize the name
+            raw_name = clean_name(name_match.group(1))
+            current_name = normalize_name(raw_name)
+
+            # Initialize the list for the current name if it's not already present
+            if current_name not in persons_data:
+                persons_data[current_name] = []
+
+        elif current_name:
+            # Gather the shift data for the current name
+            shift_data.append(line)
+
+    if current_name and shift_data:
+        # Don't forget to process the shifts for the last person in the text
+        processed_shifts = process_extracted_text_lines(shift_data)
+        if processed_shifts:
+            persons_data[current_name].extend(processed_shifts)
+
+    return persons_data
@@ -2,13 +2,12 @@
 import logging
 import os
 import pickle
-import re
+import shutil
 import tempfile
 import uuid
 from collections import Counter, defaultdict
-from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple, Union
-from zipfile import ZipFile, ZIP_DEFLATED
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from zipfile import ZipFile, ZIP_STORED
 
 # Third-Party imports
 from flask import Blueprint, current_app, flash, redirect, render_template, request, send_file, session, url_for
@@ -17,16 +16,19 @@ from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
 # Local imports
+from app.text_parse import Shift, process_extracted_text, process_multiple_persons_text
 from utils.pdf_to_text import convert_pdf_to_text
 from utils.text_to_ical import convert_shifts_to_ical
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Module-level logger; handler/level configuration happens in create_app
+log = logging.getLogger(__name__)
 
 # Constants
 ERROR_FLASH_CATEGORY = 'error'  # Category used for flashing error messages
 TEMP_DIR = tempfile.gettempdir()  # Platform-independent temporary directory for file storage
 ZIP_EXTENSION = '.zip'  # File extension for ZIP files
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Buffer size for streaming uploads to disk
+MAX_IN_MEMORY_SIZE = 20 * 1024 * 1024  # Uploads up to this size are parsed from memory
 
 bp = Blueprint('views', __name__)
 
@@ -103,9 +105,8 @@ def download():
     """
     Handles the download route ("/download").
 
-    - Retrieves the temporary filename from the user's session
-    - Loads iCal contents from the corresponding temporary file
-    - Creates a ZIP file containing these iCal contents
+    - Retrieves the temporary directory from the user's session
+    - Creates a ZIP file containing the iCal files stored there
     - Sends this ZIP file to the user as a downloadable attachment
 
     If any step fails, redirects the user to the home page and flashes an error message.
@@ -115,42 +116,36 @@ def download():
     - Redirect: Redirects to the home page if any error occurs
     """
     try:
-        # Retrieve the temporary filename from the session
-        temp_filename = session.get('temp_filename')
-        if not temp_filename:
-            raise FileNotFoundError("Session does not contain a temporary filename.")
-
-        # Load iCal contents from the temporary file
-        ical_contents = load_ical_contents_from_temp_file(temp_filename)
-        if not ical_contents:
-            raise ValueError("No iCal content found in the temporary file.")
-
-        # Generate a unique download ID and create a ZIP file
-        download_id = uuid.uuid4()
-        zip_filename = f"shifts-{download_id}.zip"
-        zip_path = os.path.join(TEMP_DIR, zip_filename)
-
-        # Create a BytesIO object to store the ZIP content
-        zip_file = BytesIO()
-
-        # Create a ZIP archive in the BytesIO object
-        with ZipFile(zip_file, 'w', ZIP_DEFLATED) as zf:
-            for person_name, ical_content in ical_contents.items():
-                filename = create_slugified_filename(person_name) + ".ics"
-                zf.writestr(filename, ical_content)
-
-        # Set the file pointer to the beginning
-        zip_file.seek(0)
-
-        # Generate a unique ZIP filename
-        zip_filename = f"shifts-{download_id}.zip"
+        # Retrieve the temporary directory from the session
+        temp_dir = session.get('temp_dir')
+        if not temp_dir or not os.path.isdir(temp_dir):
+            raise FileNotFoundError("Session does not contain a temporary directory.")
+
+        ics_filenames = sorted(f for f in os.listdir(temp_dir) if f.endswith('.ics'))
+        if not ics_filenames:
+            raise ValueError("No iCal content found in the temporary directory.")
+
+        # Create the ZIP archive on disk so send_file can stream it with
+        # sendfile(2); the entries are already slugified on disk, so no
+        # per-download slugify or encode work is needed
+        with tempfile.NamedTemporaryFile(suffix=ZIP_EXTENSION, delete=False) as zip_temp:
+            zip_path = zip_temp.name
+
+        # ZIP_STORED: the handful of small iCal files are not worth deflate's
+        # CPU cost on an interactive download
+        with ZipFile(zip_path, 'w', ZIP_STORED) as zf:
+            for filename in ics_filenames:
+                zf.write(os.path.join(temp_dir, filename), arcname=filename)
+
+        # Generate a unique ZIP filename for the download
+        zip_filename = f"shifts-{uuid.uuid4()}.zip"
 
         # Send the ZIP file as an attachment
-        return send_file(zip_file, as_attachment=True, download_name=zip_filename, mimetype='application/zip')
+        return send_file(zip_path, as_attachment=True, download_name=zip_filename, mimetype='application/zip')
 
     except (FileNotFoundError, ValueError) as e:
         # Log the error for debugging purposes
-        logging.error(f"An error occurred during file download: {e}")
+        log.error(f"An error occurred during file download: {e}")
 
         # Display an error message and redirect to the home page
         flash(f"Error: {e}", ERROR_FLASH_CATEGORY)
@@ -162,9 +157,8 @@ def download_individual(person_name: str):
     """
     Handles the download of individual ICS files.
 
-    - Retrieves the temporary filename from the user's session
-    - Loads iCal contents of the specified person from the temporary file
-    - Creates an ICS file from these contents
+    - Retrieves the temporary directory from the user's session
+    - Locates the person's iCal file within that directory
     - Sends this ICS file to the user as a downloadable attachment
 
     If any step fails, redirects the user to the home page and flashes an error message.
@@ -177,177 +171,48 @@ def download_individual(person_name: str):
     - Redirect: Redirects to the home page if any error occurs
     """
     try:
-        # Retrieve the temporary filename from the session
-        temp_filename = session.get('temp_filename')
-        if not temp_filename:
-            raise FileNotFoundError("Session does not contain a temporary filename.")
-
-        # Load iCal contents from the temporary file
-        with open(temp_filename, 'rb') as tempf:
-            ical_contents = pickle.load(tempf)
-
-        if not ical_contents:
-            raise ValueError("No iCal content found in the temporary file.")
+        # Retrieve the temporary directory from the session
+        temp_dir = session.get('temp_dir')
+        if not temp_dir or not os.path.isdir(temp_dir):
+            raise FileNotFoundError("Session does not contain a temporary directory.")
 
-        # Validate the person_name
-        if person_name not in ical_contents:
+        # Locate the person's iCal file in the temporary directory
+        filename = create_slugified_filename(person_name)
+        ics_path = os.path.join(temp_dir, f"{filename}.ics")
+        if not os.path.isfile(ics_path):
             raise KeyError(f"No data found for the specified person: {person_name}")
 
-        # Prepare individual ICS content and file path
-        ical_content = ical_contents[person_name]
+        # Generate a unique ICS filename for the download
         download_id = uuid.uuid4()
-        filename = create_slugified_filename(person_name)
-
-        # Generate a unique ICS filename
         ics_filename = f"{filename}-{download_id}.ics"
 
-        # Prepare individual ICS content
-        ical_content_encoded = ical_content.encode()
-
-        # Create a BytesIO object from the ical content
-        ics_file = BytesIO(ical_content_encoded)
-
-        # Set the file pointer to the beginning
-        ics_file.seek(0)
-
-        return send_file(ics_file, as_attachment=True, download_name=ics_filename, mimetype='text/calendar')
+        # Serve the file straight from disk, letting send_file stream it
+        return send_file(ics_path, as_attachment=True, download_name=ics_filename, mimetype='text/calendar')
 
     except (FileNotFoundError, ValueError, KeyError) as e:
-        logging.error(f"An error occurred during individual file download: {e}")
+        log.error(f"An error occurred during individual file download: {e}")
         flash(f"Error: {e}", ERROR_FLASH_CATEGORY)
         return redirect(url_for('views.home'))
 
-    finally:
-        if 'ics_path' in locals() and os.path.exists(ics_path):
-            os.remove(ics_path)
-
 
 # Utility functions
-def german_to_english_weekday(date_string):
-    """Convert German weekdays to English.
-
-    Parameters:
-        date_string (str): The date string containing German weekdays.
-
-    Returns:
-        str: The date string with German weekdays converted to English.
-    """
-
-    # Mapping of German weekdays to English weekdays
-    replacements = {
-        'Mo.': 'Mon.',
-        'Di.': 'Tue.',
-        'Mi.': 'Wed.',
-        'Do.': 'Thu.',
-        'Fr.': 'Fri.',
-        'Sa.': 'Sat.',
-        'So.': 'Sun.'
-    }
-
-    # Replace German weekdays with English weekdays
-    for german, english in replacements.items():
-        date_string = date_string.replace(german, english)
-
-    return date_string
-
 
-def normalize_entry(entry):
-    """Normalize an entry according to specified rules.
 
-    Args:
-        entry (str): The original entry string.
-
-    Returns:
-        str: The normalized entry string.
-    """
-
-    # Remove trailing zeros (e.g., "ILL0" becomes "ILL")
-    entry = re.sub(r'0$', '', entry)
-
-    # Remove time range indicators (e.g., "TRAIN 8-16" becomes "TRAIN")
-    entry = re.sub(r'\s?\d{1,2}-\d{1,2}', '', entry)
-
-    # Remove trailing numbers (e.g., "QUALITYM 12" becomes "QUALITYM")
-    entry = re.sub(r'\s?\d+$', '', entry)
-
-    # Remove any extra white spaces and return
-    return entry.strip()
-
-
-def process_line(line):
-    """Process individual lines from the extracted text."""
-    # Patterns for regular and all-day events
-    pattern_regular = re.compile(
-        r"(?P<date>[A-Za-z]+\.\s\d{2}\.\d{2}\.\d{4})\s(?P<time>\d{2}:\d{2}-\d{2}:\d{2})\s(?P<hours>\d{1,2},\d{2})(?P<entry>.*?)(?=Zeitraum|$)"
-    )
-    pattern_all_day = re.compile(
-        r"(?P<date>[A-Za-z]+\.\s\d{2}\.\d{2}\.\d{4})\sGanztägig\s(?P<hours>\d{1,2},\d{2})(?P<entry>.*?)(?=Zeitraum|$)"
-    )
-
-    # Check for matches
-    match = pattern_regular.search(line) or pattern_all_day.search(line)
-
-    return match.groupdict() if match else None
-
-
-def process_extracted_text(text):
-    """Process extracted text to capture relevant shift information.
-
-    Parameters:
-        text (str): The raw text containing shift details.
-
-    Returns:
-        list: A list of dictionaries containing processed shift details.
+def save_uploaded_file(file: FileStorage) -> Optional[Union[str, BinaryIO]]:
     """
-
-    # Initialize an empty list to store shift details
-    shifts = []
-
-    # Process each line in the input text
-    for line in text.split("\n"):
-        processed_line = process_line(line)
-        if processed_line:
-            # Extract details
-            date = german_to_english_weekday(processed_line.get("date", ""))
-            shift_time = processed_line.get("time", "All Day")
-            hours = processed_line.get("hours", "N/A")
-
-            # Determine if it's an all-day event
-            is_all_day = shift_time == "All Day"
-
-            # Remove time from entry, if present
-            entry = processed_line.get("entry", "").strip()
-            if not is_all_day:
-                entry = re.sub(r'\d{1,2}:\d{2}-\d{1,2}:\d{2}', '', entry).strip()
-
-            # Normalize the entry based on the specified rules
-            entry = normalize_entry(entry)
-
-            # Add processed details to shifts
-            shifts.append({
-                "date": date,
-                "shift_time": shift_time,
-                "hours": hours,
-                "entry": entry,
-                "all_day": is_all_day
-            })
-
-    return shifts
-
-
-def save_uploaded_file(file: FileStorage) -> Optional[str]:
-    """
-    Saves the uploaded file to the server's file system.
+    Makes the uploaded file available for processing.
 
     - Checks if the uploaded file exists and is of a valid type
-    - Generates a secure filename and determines the path for saving
-    - Saves the file to the specified path
+    - Returns the upload as an in-memory buffer when it fits within
+      MAX_IN_MEMORY_SIZE, bounding peak RSS for large files
+    - Otherwise generates a secure filename and streams the file to disk
 
     Parameters:
     - file (FileStorage): The uploaded file object from the Flask request
 
     Returns:
-    - str: The path to the saved file if successful
+    - BinaryIO: The upload stream itself for small files
+    - str: The path to the saved file for large files
     - None: None if saving fails for any reason, while setting an error flash message
     """
     try:
@@ -368,12 +233,26 @@ def save_uploaded_file(file: FileStorage) -> Optional[str]:
             flash('File type not allowed', ERROR_FLASH_CATEGORY)
             return None
 
+        # Small uploads are handed to the PDF parser straight from memory,
+        # skipping the disk round-trip entirely
+        file.stream.seek(0, os.SEEK_END)
+        upload_size = file.stream.tell()
+        file.stream.seek(0)
+
+        if upload_size <= MAX_IN_MEMORY_SIZE:
+            # Hand the request stream straight to the parser; copying it
+            # into a fresh buffer first would double the upload's footprint
+            return file.stream
+
         # Secure the filename and save the file
         secure_name = secure_filename(filename)
         upload_folder = current_app.config['UPLOAD_FOLDER']
         file_path = os.path.join(upload_folder, secure_name)
 
-        file.save(file_path)
+        # Stream the upload to disk in large chunks instead of file.save(),
+        # which copies through Werkzeug's default small buffer
+        with open(file_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as out:
+            shutil.copyfileobj(file.stream, out, length=UPLOAD_CHUNK_SIZE)
 
         return file_path
 
@@ -388,7 +267,7 @@ def save_uploaded_file(file: FileStorage) -> Optional[str]:
         return None
 
 
-def process_text_and_generate_stats(extracted_text: str) -> Tuple[Optional[List[Dict]], Optional[Dict]]:
+def process_text_and_generate_stats(extracted_text: str) -> Tuple[Optional[Dict[str, List[Shift]]], Optional[Dict]]:
     """
     Processes the extracted text to generate individual shift data and overall statistics.
 
@@ -399,8 +278,8 @@ def process_text_and_generate_stats(extracted_text: str) -> Tuple[Optional[List[
     - extracted_text (str): The raw text extracted from the uploaded file
 
     Returns:
-    - Tuple: A tuple containing the persons_data list and the statistics dictionary
-        - persons_data: List of dictionaries, each containing shift data for a person
+    - Tuple: A tuple containing the persons_data mapping and the statistics dictionary
+        - persons_data: Dictionary mapping each person's name to their list of Shift records
         - stats: Dictionary containing statistical information about shifts
     """
     persons_data = None
@@ -425,13 +304,13 @@ def process_text_and_generate_stats(extracted_text: str) -> Tuple[Optional[List[
         save_ical_to_tempfile(ical_contents)
 
     except ValueError as ve:
-        logging.error(f"An error occurred: {ve}")
+        log.error(f"An error occurred: {ve}")
         # Optionally, you could add a flash message here for UI feedback
 
     return persons_data, stats
 
 
-def create_ical_contents(persons_data: Dict[str, List[Any]]) -> Optional[Dict[str, str]]:
+def create_ical_contents(persons_data: Dict[str, List[Any]]) -> Optional[Dict[str, bytes]]:
     """
     Generates iCal data for each person based on their shift data.
 
@@ -440,9 +319,9 @@ def create_ical_contents(persons_data: Dict[str, List[Any]]) -> Optional[Dict[st
                                            and a list of their shifts as the corresponding value.
 
     Returns:
-    - Optional[Dict[str, str]]: A dictionary with each person's name as a key and their
-                                 corresponding iCal data as the value. Returns None if
-                                 persons_data is empty or None.
+    - Optional[Dict[str, bytes]]: A dictionary with each person's name as a key and their
+                                  corresponding UTF-8 encoded iCal data as the value.
+                                  Returns None if persons_data is empty or None.
     """
     if not persons_data:
         return None
@@ -457,88 +336,61 @@ def create_ical_contents(persons_data: Dict[str, List[Any]]) -> Optional[Dict[st
             if ical_data is None:
                 raise ValueError(f"Failed to generate iCal data for {person}")
 
-            ical_contents[person] = ical_data
+            # Encode once here so downstream file and ZIP writers deal in
+            # ready-made bytes
+            ical_contents[person] = ical_data.encode('utf-8')
 
     except Exception as e:
-        logging.error(f"An error occurred while generating iCal contents: {e}")
+        log.error(f"An error occurred while generating iCal contents: {e}")
         return None
 
     return ical_contents
 
 
-def save_ical_to_tempfile(ical_contents: Dict[str, str]) -> Optional[str]:
+def save_ical_to_tempfile(ical_contents: Dict[str, bytes]) -> Optional[str]:
     """
-    Save iCal content to a temporary file and store the filename in the session.
+    Save iCal content to a temporary directory and store its path in the session.
+
+    Each person's calendar is written as an individual '<slug>.ics' file so
+    download routes can serve it directly without deserializing the whole
+    contents dictionary first.
 
     Parameters:
-    - ical_contents (Dict[str, str]): Dictionary containing iCal data for each person.
+    - ical_contents (Dict[str, bytes]): Dictionary containing the UTF-8 encoded
+      iCal data for each person.
 
     Returns:
-    - Optional[str]: The name of the temporary file, or None if saving fails.
+    - Optional[str]: The path of the temporary directory, or None if saving fails.
     """
     try:
         if not ical_contents:
             raise ValueError("The ical_contents parameter cannot be empty or None.")
 
-        # Create and save the temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as tempf:
-            pickle.dump(ical_contents, tempf)
+        # Write one plain .ics file per person into a fresh temporary directory
+        temp_dir = tempfile.mkdtemp(prefix='sp5ical-')
+        for person, ical_content in ical_contents.items():
+            ics_path = os.path.join(temp_dir, create_slugified_filename(person) + '.ics')
+            with open(ics_path, 'wb') as ics_file:
+                ics_file.write(ical_content)
 
-        # Store the temporary filename in the session
-        session['temp_filename'] = tempf.name
-        return tempf.name
+        # Store the temporary directory in the session
+        session['temp_dir'] = temp_dir
+        return temp_dir
 
     except Exception as e:
-        logging.error(f"An error occurred while saving the temporary iCal file: {e}")
+        log.error(f"An error occurred while saving the temporary iCal files: {e}")
         return None
 
 
-class TempFileReadError(Exception):
-    """
-    Exception raised when reading from a temporary file fails.
-
-    Attributes:
-        message -- explanation of the error
-        filename -- name of the file causing the error
-    """
-
-    def __init__(self, message: str, filename: str = None):
-        self.message = message
-        self.filename = filename
-        super().__init__(self.message)
-
-    def __str__(self):
-        return f"{self.message}. Filename: {self.filename}" if self.filename else self.message
-
-
-def load_ical_contents_from_temp_file(temp_filename: str) -> Optional[Dict[str, Any]]:
-    """
-    Load iCal contents from a temporary file.
-
-    Parameters:
-    - temp_filename (str): The name of the temporary file to read from.
-
-    Returns:
-    - Optional[Dict[str, Any]]: The iCal contents loaded from the file, or None if loading fails.
-
-    Raises:
-    - TempFileReadError: If any error occurs while reading the temporary file.
-    """
-    try:
-        with open(temp_filename, 'rb') as tempf:
-            return pickle.load(tempf)
-    except (FileNotFoundError, pickle.UnpicklingError, EOFError) as e:
-        logging.error(f"An error occurred while reading the temporary file {temp_filename}: {str(e)}")
-        raise TempFileReadError(f"An error occurred while reading the temporary file {temp_filename}") from e
-
-
-def create_zip_from_ical_contents(ical_contents: Dict[str, str], download_id: Union[str, int]) -> str:
+def create_zip_from_ical_contents(ical_contents: Dict[str, bytes], zip_path: Optional[str] = None) -> str:
     """
     Create a ZIP file from iCal content and returns its path.
 
     Parameters:
-    - ical_contents (Dict[str, str]): A dictionary mapping person names to their iCal content.
-    - download_id (Union[str, int]): A unique identifier for the download.
+    - ical_contents (Dict[str, bytes]): A dictionary mapping person names to their
+      UTF-8 encoded iCal content.
+    - zip_path (Optional[str]): The destination path for the archive. A fresh
+      temporary file is created when omitted.
 
     Returns:
     - str: The path to the created ZIP file.
@@ -547,10 +399,14 @@ def create_zip_from_ical_contents(ical_contents: Dict[str, str], download_id: Un
     - Exception: If any error occurs during the ZIP file creation.
     """
     try:
-        zip_path = f'{TEMP_DIR}{download_id}{ZIP_EXTENSION}'
+        if zip_path is None:
+            # NamedTemporaryFile is atomic, unlike concatenating an id onto
+            # TEMP_DIR (which was also missing the path separator)
+            with tempfile.NamedTemporaryFile(suffix=ZIP_EXTENSION, delete=False) as zip_temp:
+                zip_path = zip_temp.name
 
         # Using ZipFile context manager to automatically close the file
-        with ZipFile(zip_path, 'w', ZIP_DEFLATED) as zipf:
+        with ZipFile(zip_path, 'w', ZIP_STORED) as zipf:
             for name, ical_content in ical_contents.items():
                 # Create a slugified filename without the extension
                 filename_without_extension = create_slugified_filename(name)
@@ -558,12 +414,12 @@ def create_zip_from_ical_contents(ical_contents: Dict[str, str], download_id: Un
                 # Add the file extension '.ics' here
                 filename_with_extension = f"{filename_without_extension}.ics"
 
-                zipf.writestr(filename_with_extension, ical_content.encode())
+                zipf.writestr(filename_with_extension, ical_content)
 
         return zip_path
 
     except (FileNotFoundError, PermissionError) as e:
-        logging.error(f"An error occurred while creating the ZIP file: {e}")
+        log.error(f"An error occurred while creating the ZIP file: {e}")
         # If required, you can raise an exception here for the caller to handle
         raise
 
@@ -583,14 +439,14 @@ def send_and_cleanup(zip_path, temp_filename):
 
     try:
         if not zip_path or not temp_filename:
-            logging.error("Missing file paths for sending and cleaning up.")
+            log.error("Missing file paths for sending and cleaning up.")
             raise ValueError("Both zip_path and temp_filename must be provided.")
 
         # Sends the ZIP file as an attachment.
         return send_file(zip_path, as_attachment=True, download_name='shifts.zip')
 
     except Exception as e:
-        logging.error(f"An error occurred while sending the ZIP file: {e}")
+        log.error(f"An error occurred while sending the ZIP file: {e}")
         # Optionally, raise an exception for the caller to handle.
         raise
 
@@ -611,10 +467,10 @@ def cleanup_files(file_paths):
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                logging.info(f"Successfully deleted: {file_path}")
+                log.info(f"Successfully deleted: {file_path}")
 
         except Exception as e:
-            logging.error(f"An error occurred while deleting the file {file_path}: {e}")
+            log.error(f"An error occurred while deleting the file {file_path}: {e}")
 
 
 # Additional helper functions
@@ -685,118 +541,32 @@ def create_individual_temp_file(ical_content, person_name):
 
     # Open the temporary file in binary write mode ('wb') and save the ical_content
     with open(temp_file_name, 'wb') as f:
-        pickle.dump(ical_content, f)
+        pickle.dump(ical_content, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     return temp_file_name
 
 
-def normalize_name(name):
-    """Normalizes a name by removing any "(Forts.)" suffix from it.
-
-    Parameters:
-        name (str): The original name that may contain a "(Forts.)" suffix.
-
-    Returns:
-        str: The name with the "(Forts.)" suffix removed, if it was present.
-
-    Examples:
-        >>> normalize_name("John (Forts.)")
-        "John"
-        >>> normalize_name("John")
-        "John"
-
-    Notes:
-        - The function assumes that "(Forts.)" occurs only as a suffix in the name.
-        - This function is case-sensitive.
-    """
-
-    # Remove "(Forts.)" suffix from the name by splitting on it and taking the first part
-    return name.split(' (Forts.)')[0]
-
-
-def process_multiple_persons_text(text):
-    """
-    Process a block of text to extract information about multiple persons and their shifts.
-
-    Parameters:
-        text (str): The block of text containing information about multiple persons and their shifts.
-
-    Returns:
-        dict: A dictionary where each key is a normalized name and the value is a list of shift data for that person.
-
-    Example:
-        Input text:
-        "Doe, John\nShift 1\nShift 2\nDoe, Jane (Forts.)\nShift 3"
-        Output:
-        {"Doe, John": ["Shift 1", "Shift 2"], "Doe, Jane": ["Shift 3"]}
-    """
-
-    def clean_name(name):
-        """Clean up the name by removing extra white spaces and standardizing the format."""
-        name = name.strip()
-        name = re.sub(r'\s+', ' ', name)  # Remove extra white spaces
-        return re.sub(r'\s*,\s*', ', ', name)  # Ensure single space after comma
-
-    lines = text.strip().split("\n")
-    persons_data = {}
-    current_name = None
-    shift_data = []  # This list will store the shift data associated with a name
-
-    for line in lines:
-        # Regular expression pattern to match names
-        name_match = re.search(r'^([a-zA-ZäöüÄÖÜß\s]+,\s*[a-zA-ZäöüÄÖÜß\s]+)', line)
-
-        if name_match:
-            if current_name:
-                # Process the shift information for the previous person
-                processed_shifts = process_extracted_text("\n".join(shift_data))
-                if processed_shifts:
-                    persons_data[current_name].extend(processed_shifts)
-                shift_data = []  # Clear shift data before moving on to the next person
-
-            # Clean and normalize the name
-            raw_name = clean_name(name_match.group(1))
-            current_name = normalize_name(raw_name)
-
-            # Initialize the list for the current name if it's not already present
-            if current_name not in persons_data:
-                persons_data[current_name] = []
-
-        elif current_name:
-            # Gather the shift data for the current name
-            shift_data.append(line)
-
-    if current_name and shift_data:
-        # Don't forget to process the shifts for the last person in the text
-        processed_shifts = process_extracted_text("\n".join(shift_data))
-        if processed_shifts:
-            persons_data[current_name].extend(processed_shifts)
-
-    return persons_data
-
-
-def create_shift_statistics(persons_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, int]]:
+def create_shift_statistics(persons_data: Dict[str, List[Shift]]) -> Dict[str, Dict[str, int]]:
     """
     Generate statistics on shifts for each person in the provided data.
 
     Parameters:
-    - persons_data (Dict[str, List[Dict[str, Any]]]): Dictionary where keys are names
-      and values are lists of dictionaries containing shift data.
+    - persons_data (Dict[str, List[Shift]]): Dictionary where keys are names
+      and values are lists of Shift records containing shift data.
 
     Returns:
     - all_stats (Dict[str, Dict[str, int]]): Dictionary where keys are names and values are
       dictionaries containing shift statistics for each unique shift entry.
     """
-    all_stats = {}  # Initialize a dictionary to hold the shift statistics for each person
+    # Initialize a Counter per person, then let Counter.update consume each
+    # person's entries in one C-level pass
+    all_stats = {person: Counter() for person in persons_data}
 
     for person, shifts in persons_data.items():
-        # Use Counter to collect statistics for the current person efficiently
-        stats = Counter(shift["entry"] for shift in shifts)
+        all_stats[person].update(shift.entry for shift in shifts)
 
-        # Convert the Counter to a regular dictionary and store it in all_stats
-        all_stats[person] = dict(stats)
-
-    return all_stats
+    # Convert the Counters to regular dictionaries
+    return {person: dict(stats) for person, stats in all_stats.items()}
 
 
 def process_full_text(text: str) -> Tuple[Optional[str], Optional[List[Dict[str, str]]]]:
@@ -849,19 +619,20 @@ def allowed_file(filename: str) -> bool:
     if not filename:
         return False
 
-    # Ensure the filename contains a period, indicating an extension
-    if '.' not in filename:
-        return False
-
-    # Extract and normalize the file extension from the filename
-    file_extension = filename.rsplit('.', 1)[1].strip().lower()
+    # Extract and normalize the file extension; splitext runs in C, handles
+    # the no-extension cases, and avoids the list allocation of rsplit
+    file_extension = os.path.splitext(filename)[1].lower().lstrip('.')
 
     # Validate that the extracted extension is not empty
     if not file_extension:
         return False
 
-    # Check if the extracted extension is among the list of allowed extensions
-    return file_extension in current_app.config['ALLOWED_EXTENSIONS']
+    # Check the extension against the frozenset cached at app-creation time
+    # (single proxy access instead of a config lookup per call)
+    allowed = current_app.extensions.get('allowed_ext')
+    if allowed is None:
+        allowed = frozenset(map(str.lower, current_app.config['ALLOWED_EXTENSIONS']))
+    return file_extension in allowed
 
 
 def common_slugify(text: str) -> Optional[str]:
@@ -881,7 +652,7 @@ def common_slugify(text: str) -> Optional[str]:
         return slugified_text
 
     except Exception as e:
-        logging.error(f"An error occurred while slugifying the text: {e}")
+        log.error(f"An error occurred while slugifying the text: {e}")
         raise
 
 
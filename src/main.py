@@ -1,20 +1,44 @@
+import logging
 import os
+import socket
 import sys  # Import sys module
+import time
 import webbrowser
-from threading import Timer
+from threading import Thread
 from flask import Flask
 from app.views import bp as views_bp
 
 # Constants
 UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'pdf'}
+ALLOWED_EXTENSIONS = frozenset({'pdf'})
+MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # Reject uploads larger than 50 MB
+
+
+def _load_secret_key(upload_path):
+    # Reuse the secret key across restarts so existing session cookies stay
+    # valid; generate and store one on first launch
+    key_path = os.path.join(upload_path, '.secret_key')
+    try:
+        with open(key_path, 'rb') as f:
+            key = f.read()
+        if key:
+            return key
+    except OSError:
+        pass
+
+    key = os.urandom(24)
+    # Owner-only permissions: the key file must not be readable by other
+    # local users
+    fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
 
 
 def create_app():
     # Create upload folder if it doesn't exist
     upload_path = os.path.join(os.getcwd(), UPLOAD_FOLDER)
-    if not os.path.exists(upload_path):
-        os.makedirs(upload_path)
+    os.makedirs(upload_path, exist_ok=True)
 
     # Determine the template folder
     if getattr(sys, 'frozen', False):  # Check if the app is running as a bundled EXE
@@ -23,12 +47,21 @@ def create_app():
     else:
         app = Flask(__name__, template_folder='app/templates')
 
-    # Set the secret key
-    app.secret_key = os.urandom(24)
+    # Configure app in one bulk update (also sets the secret key)
+    app.config.from_mapping(
+        SECRET_KEY=_load_secret_key(upload_path),
+        UPLOAD_FOLDER=UPLOAD_FOLDER,
+        ALLOWED_EXTENSIONS=ALLOWED_EXTENSIONS,
+        MAX_CONTENT_LENGTH=MAX_CONTENT_LENGTH
+    )
 
-    # Configure app
-    app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-    app.config['ALLOWED_EXTENSIONS'] = ALLOWED_EXTENSIONS
+    # Cache the normalized extension set so allowed_file skips repeated
+    # config lookups through the app proxy
+    app.extensions['allowed_ext'] = frozenset(map(str.lower, ALLOWED_EXTENSIONS))
+
+    # Configure logging once here instead of at blueprint import time, so
+    # a WSGI server's logging setup is not clobbered by duplicate handlers
+    app.logger.setLevel(logging.INFO)
 
     # Register blueprints
     app.register_blueprint(views_bp)
@@ -36,16 +69,29 @@ def create_app():
     return app
 
 
-# Function to open the web browser
-def open_browser():
-    webbrowser.open_new('http://127.0.0.1:5000/')
+# Function to open the web browser once the server socket accepts connections
+def open_browser(host='127.0.0.1', port=5000, deadline=10.0):
+    # Poll the socket instead of sleeping a fixed second: the browser opens
+    # as soon as Flask is actually listening, and never hits a connection
+    # refused from launching too early
+    end = time.monotonic() + deadline
+    while time.monotonic() < end:
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
+                break
+        except OSError:
+            time.sleep(0.02)
+    else:
+        return
+
+    webbrowser.open_new(f'http://{host}:{port}/')
 
 
 if __name__ == '__main__':
     app = create_app()
 
-    # Open web browser 1 second after Flask server starts
-    Timer(1, open_browser).start()
+    # Open the web browser as soon as the Flask server is ready
+    Thread(target=open_browser, daemon=True).start()
 
     # Run Flask app with debug set to False for production
     app.run(debug=False)
@@ -1,62 +1,157 @@
-from ics import Calendar, Event
-from datetime import datetime, timedelta
-from dateutil import tz
+import functools
+import logging
+import re
+import uuid
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+log = logging.getLogger(__name__)
+
+
+def _parse_date(date_str):
+    """Parse a '%a. %d.%m.%Y' date string by direct slicing.
+
+    The format is fully fixed-width ('Mon. 01.01.2024'), so slicing out the
+    digit runs skips strptime's per-call format interpretation; malformed
+    input still raises ValueError just like strptime would.
+    """
+    return datetime(int(date_str[11:15]), int(date_str[8:10]), int(date_str[5:7]))
+
+
+def _parse_hm(time_str):
+    """Parse a fixed-width 'HH:MM' string into a time by direct slicing."""
+    return time(int(time_str[:2]), int(time_str[3:5]))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_tz(name):
+    """Return the tzinfo for a timezone name, cached across calls.
+
+    tzinfo objects are immutable and thread-safe, so one instance per name
+    can be reused for every conversion instead of re-resolving the zone on
+    each request. Returns None for unknown zone names.
+    """
+    try:
+        return ZoneInfo(name)
+    except (KeyError, ValueError, OSError):
+        return None
+
+
+def _fmt_date(d):
+    """Format a date as an iCal DATE value (YYYYMMDD)."""
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
+
+def _fmt_datetime(d, t):
+    """Format a date/time pair as an iCal local DATE-TIME (YYYYMMDDTHHMMSS)."""
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}T{t.hour:02d}{t.minute:02d}00"
+
+
+# Characters RFC 5545 reserves in TEXT property values, escaped in a single
+# substitution pass instead of one str.replace scan per character
+_ICAL_ESC = re.compile(r'[\\,;\n]')
+_ICAL_ESC_MAP = {'\\': '\\\\', ',': '\\,', ';': '\\;', '\n': '\\n'}
+
+
+def _escape_text(text):
+    """Escape the characters RFC 5545 reserves in TEXT property values."""
+    return _ICAL_ESC.sub(lambda m: _ICAL_ESC_MAP[m.group()], text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_shift_times(date_str, shift_time, all_day):
+    """Return the formatted (DTSTART, DTEND) values for a shift, cached.
+
+    Rosters repeat the same (date, time range) pair across recurring shift
+    templates and co-workers, so the second and later occurrences — also
+    across requests — collapse into a dict lookup. The entry text stays out
+    of the key, letting shifts with distinct summaries share their parsed
+    times; the values are local wall-clock strings, so the key does not
+    need the timezone either.
+    """
+    start_date = _parse_date(date_str)
+    if all_day:
+        end_date = start_date + timedelta(days=1)
+        return _fmt_date(start_date), _fmt_date(end_date)
+
+    start_time_str, end_time_str = shift_time.split("-")
+    start_time = _parse_hm(start_time_str)
+    end_time = _parse_hm(end_time_str)
+
+    # Shifts ending past midnight roll over to the next day
+    if end_time < start_time:
+        end_date = start_date + timedelta(days=1)
+    else:
+        end_date = start_date
+
+    return _fmt_datetime(start_date, start_time), _fmt_datetime(end_date, end_time)
 
 
 def convert_shifts_to_ical(shifts, timezone='Europe/Vienna'):
     """
-    Converts a list of shift dictionaries into an iCal formatted calendar string.
+    Converts a list of Shift record lists into an iCal formatted calendar string.
+
+    The VCALENDAR text is emitted directly instead of going through a
+    calendar object model, so serializing N events is a flat loop appending
+    preformatted lines.
 
     Parameters:
-        shifts (list): A list of shift dictionaries with details.
+        shifts (list): A list of Shift record lists with details.
         timezone (str): The string representation of the timezone. Default is 'Europe/Vienna'.
 
     Returns:
         str: The iCal formatted calendar string.
     """
-    cal = Calendar()
-
-    tz_info = tz.gettz(timezone)
+    tz_info = _get_tz(timezone)
     if not tz_info:
-        print(f"Invalid timezone: {timezone}")
+        log.error(f"Invalid timezone: {timezone}")
         return None
 
-    def create_event(shift):
-        """Creates an Event instance based on a single shift dictionary."""
-        e = Event()
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//SP5ToICalExp//EN",
+    ]
+    dtstamp = datetime.now(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
+    def append_event(shift):
+        """Append the VEVENT lines for a single Shift record."""
         try:
-            start_date = datetime.strptime(shift["date"], "%a. %d.%m.%Y")
+            start_value, end_value = _parse_shift_times(
+                shift.date, shift.shift_time, shift.all_day
+            )
+            summary = _escape_text(shift.entry)
 
-            if shift.get("all_day", False):
-                e.name = shift["entry"]
-                start_date = datetime.strptime(shift["date"], "%a. %d.%m.%Y").date()
-                e.begin = start_date
-                e.make_all_day()
-            else:
-                start_time_str, end_time_str = shift["shift_time"].split("-")
-                start_time = datetime.strptime(start_time_str, "%H:%M").time()
-                end_time = datetime.strptime(end_time_str, "%H:%M").time()
+            event_lines = [
+                "BEGIN:VEVENT",
+                f"UID:{uuid.uuid4()}",
+                f"DTSTAMP:{dtstamp}",
+            ]
 
-                start_datetime = datetime.combine(start_date, start_time).replace(tzinfo=tz_info)
-                end_datetime = datetime.combine(start_date, end_time).replace(tzinfo=tz_info)
+            if shift.all_day:
+                event_lines.append(f"DTSTART;VALUE=DATE:{start_value}")
+                event_lines.append(f"DTEND;VALUE=DATE:{end_value}")
+            else:
+                # The emitted DATE-TIMEs are local wall-clock values; the
+                # TZID parameter carries the zone
+                event_lines.append(f"DTSTART;TZID={timezone}:{start_value}")
+                event_lines.append(f"DTEND;TZID={timezone}:{end_value}")
 
-                if end_datetime < start_datetime:
-                    end_datetime += timedelta(days=1)
+            event_lines.append(f"SUMMARY:{summary}")
+            event_lines.append("END:VEVENT")
+            lines.extend(event_lines)
 
-                e.name = shift["entry"]
-                e.begin = start_datetime
-                e.end = end_datetime
+        except (ValueError, AttributeError) as ex:
+            log.error(f"Error occurred while creating an event: {ex}. Shift: {shift}")
 
-            return e
-        except (ValueError, KeyError) as ex:
-            print(f"Error occurred while creating an event: {ex}. Shift: {shift}")
-            return None
+    # Flatten and sort by date string so identical dates (and their cached
+    # parses in _parse_shift_times) are visited in runs rather than
+    # scattered across the roster
+    all_shifts = [shift for shift_list in shifts for shift in shift_list]
+    all_shifts.sort(key=lambda shift: shift.date)
 
-    for shift_list in shifts:
-        for shift in shift_list:
-            event = create_event(shift)
-            if event:
-                cal.events.add(event)
+    for shift in all_shifts:
+        append_event(shift)
 
-    return cal.serialize()
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"